@@ -2,17 +2,20 @@ import discord
 from discord.ext import commands, tasks
 from discord.ui import Button, View
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 from collections import defaultdict
 import os
 from typing import Optional, Dict, List
 from dotenv import load_dotenv
 import logging
+import hashlib
+import functools
+import orjson
+import time
 import atexit
 import signal
+import sys
 import psycopg2
-from psycopg2.extras import Json
-import json
 
 load_dotenv()
 
@@ -22,17 +25,29 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Embed colors - allocated once, shared by every embed
+_BLUE = discord.Color.blue()
+_DARK_RED = discord.Color.dark_red()
+_GOLD = discord.Color.gold()
+_GREEN = discord.Color.green()
+_ORANGE = discord.Color.orange()
+_RED = discord.Color.red()
+
 class Config:
     OWNER_ID = 1439497398190866495
     TOKEN = os.getenv('DISCORD_BOT_TOKEN')
     DATABASE_URL = os.getenv('DATABASE_URL')  # ⭐ PostgreSQL URL from Render
     PREFIX = '!'
     PORT = int(os.getenv('PORT', 8080))
+    SOCKET_PATH = os.getenv('SOCKET_PATH')  # Serve on a UNIX socket behind a local proxy
+    STATUS_CACHE_TTL = 5
     
     # Reputation Settings
     VOUCH_REP_AMOUNT = 3
     VOUCH_COOLDOWN = 600
+    VOUCH_HISTORY_LIMIT = int(os.getenv('VOUCH_HISTORY_LIMIT', 0))  # Per user, 0 = keep all
     LEADERBOARD_PER_PAGE = 10
+    LEADERBOARD_CACHE_TTL = 30
     
     # Staff role IDs
     STAFF_ROLE_IDS = [
@@ -48,6 +63,14 @@ class Config:
     HELPVOUCH_REP_STAFF = 2
     DUMMY_PER_DAY = 3
     DUMMY_REP_REMOVE = 3
+    
+    # Unexpected command errors - max replies per user per window
+    ERROR_REPLY_RATE = 3
+    ERROR_REPLY_PER = 10
+    
+    # Database settings
+    # 'off' lets Postgres acknowledge commits before the WAL is flushed to disk
+    DB_SYNCHRONOUS_COMMIT = os.getenv('DB_SYNCHRONOUS_COMMIT', 'off')
 
 class DatabaseManager:
     """PostgreSQL Database - DATA PERSISTS FOREVER"""
@@ -60,6 +83,14 @@ class DatabaseManager:
             raise ValueError("DATABASE_URL environment variable required")
         
         self.conn = None
+        
+        # Leaderboard caches - version is bumped on every reputation write
+        self._lb_version = 0
+        self._lb_cache = None
+        self._totals_cache = None
+    
+    def setup(self):
+        """Connect and create tables (blocking - run off the event loop)"""
         self.connect()
         self.init_database()
         logging.info("✅ Database connected")
@@ -69,6 +100,10 @@ class DatabaseManager:
         try:
             self.conn = psycopg2.connect(self.db_url)
             self.conn.autocommit = True
+            
+            cursor = self.conn.cursor()
+            cursor.execute('SET synchronous_commit TO %s', (Config.DB_SYNCHRONOUS_COMMIT,))
+            cursor.close()
             logging.info("✅ PostgreSQL connected")
         except Exception as e:
             logging.error(f"❌ Connection failed: {e}")
@@ -138,7 +173,27 @@ class DatabaseManager:
                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
               )
           ''')
-            
+
+            # Indexes - leaderboard reads ranked users in order
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_users_reputation
+                ON users (reputation DESC) WHERE reputation > 0
+            ''')
+
+            # Indexes - history tables are append-only, read per user newest first
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_vouches_target
+                ON vouches (target_id, created_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_helpvouches_target
+                ON helpvouches (target_id)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_scammer_reports_user
+                ON scammer_reports (user_id, created_at DESC)
+            ''')
+
             cursor.close()
             logging.info("✅ Database tables created")
             
@@ -162,8 +217,8 @@ class DatabaseManager:
             logging.error(f"Error getting rep: {e}")
             return 0
     
-    def add_reputation(self, user_id: int, amount: int):
-        """Add reputation"""
+    def add_reputation(self, user_id: int, amount: int) -> Optional[int]:
+        """Add reputation, returns new reputation (None on error)"""
         try:
             cursor = self.conn.cursor()
             cursor.execute('''
@@ -171,13 +226,18 @@ class DatabaseManager:
                 VALUES (%s, %s)
                 ON CONFLICT (user_id)
                 DO UPDATE SET reputation = users.reputation + %s
+                RETURNING reputation
             ''', (user_id, amount, amount))
+            new_rep = cursor.fetchone()[0]
+            self._lb_version += 1
             cursor.close()
+            return new_rep
         except Exception as e:
             logging.error(f"Error adding rep: {e}")
+            return None
     
-    def remove_reputation(self, user_id: int, amount: int):
-        """Remove reputation"""
+    def remove_reputation(self, user_id: int, amount: int) -> Optional[int]:
+        """Remove reputation, returns new reputation (None on error)"""
         try:
             cursor = self.conn.cursor()
             cursor.execute('''
@@ -185,13 +245,18 @@ class DatabaseManager:
                 VALUES (%s, 0)
                 ON CONFLICT (user_id)
                 DO UPDATE SET reputation = GREATEST(0, users.reputation - %s)
+                RETURNING reputation
             ''', (user_id, amount))
+            new_rep = cursor.fetchone()[0]
+            self._lb_version += 1
             cursor.close()
+            return new_rep
         except Exception as e:
             logging.error(f"Error removing rep: {e}")
+            return None
     
-    def set_reputation(self, user_id: int, amount: int):
-        """Set reputation"""
+    def set_reputation(self, user_id: int, amount: int) -> Optional[int]:
+        """Set reputation, returns new reputation (None on error)"""
         try:
             cursor = self.conn.cursor()
             cursor.execute('''
@@ -199,63 +264,136 @@ class DatabaseManager:
                 VALUES (%s, %s)
                 ON CONFLICT (user_id)
                 DO UPDATE SET reputation = %s
+                RETURNING reputation
             ''', (user_id, amount, amount))
+            new_rep = cursor.fetchone()[0]
+            self._lb_version += 1
             cursor.close()
+            return new_rep
         except Exception as e:
             logging.error(f"Error setting rep: {e}")
+            return None
     
     def clear_reputation(self, user_id: int):
         """Clear user data"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM users WHERE user_id = %s', (user_id,))
-            cursor.execute('DELETE FROM vouches WHERE target_id = %s', (user_id,))
-            cursor.execute('DELETE FROM helpvouches WHERE target_id = %s', (user_id,))
+            # Single statement so a dropped connection can't leave partial data
+            cursor.execute('''
+                WITH v AS (DELETE FROM vouches WHERE target_id = %s),
+                     h AS (DELETE FROM helpvouches WHERE target_id = %s)
+                DELETE FROM users WHERE user_id = %s
+            ''', (user_id, user_id, user_id))
+            self._lb_version += 1
             cursor.close()
         except Exception as e:
             logging.error(f"Error clearing rep: {e}")
     
-    def get_leaderboard(self) -> List[tuple]:
-        """Get leaderboard"""
+    def get_leaderboard(self, limit: Optional[int] = None) -> List[tuple]:
+        """Get leaderboard, optionally only the top `limit` (cached until reputation changes)"""
+        version = self._lb_version
+        cached = self._lb_cache
+        if cached and cached[0] == version and time.monotonic() - cached[1] < Config.LEADERBOARD_CACHE_TTL:
+            return cached[2] if limit is None else cached[2][:limit]
+        
         try:
             cursor = self.conn.cursor()
+            # LIMIT NULL is no limit - top-K reads stop early on the reputation index
             cursor.execute('''
                 SELECT user_id, reputation 
                 FROM users 
                 WHERE reputation > 0
                 ORDER BY reputation DESC
-            ''')
+                LIMIT %s
+            ''', (limit,))
             result = cursor.fetchall()
             cursor.close()
+            if limit is None:
+                self._lb_cache = (version, time.monotonic(), result)
             return result
         except Exception as e:
             logging.error(f"Error getting leaderboard: {e}")
             return []
     
+    def get_reputation_totals(self) -> tuple[int, int]:
+        """Get ranked user count and total reputation (cached until reputation changes)"""
+        version = self._lb_version
+        cached = self._totals_cache
+        if cached and cached[0] == version and time.monotonic() - cached[1] < Config.LEADERBOARD_CACHE_TTL:
+            return cached[2]
+        
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*), COALESCE(SUM(reputation), 0)
+                FROM users
+                WHERE reputation > 0
+            ''')
+            total_users, total_rep = cursor.fetchone()
+            cursor.close()
+            self._totals_cache = (version, time.monotonic(), (total_users, total_rep))
+            return total_users, total_rep
+        except Exception as e:
+            logging.error(f"Error getting reputation totals: {e}")
+            return 0, 0
+    
+    def get_rank(self, reputation: int) -> tuple[Optional[int], int]:
+        """Get rank for a reputation value and total ranked users"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) FILTER (WHERE reputation > %s) + 1, COUNT(*)
+                FROM users
+                WHERE reputation > 0
+            ''', (reputation,))
+            rank, total = cursor.fetchone()
+            cursor.close()
+            return (rank if reputation > 0 else None), total
+        except Exception as e:
+            logging.error(f"Error getting rank: {e}")
+            return None, 0
+    
     # ========================================
     # VOUCH FUNCTIONS
     # ========================================
     
-    def add_vouch(self, target_id: int, voucher_id: int, reason: str):
-        """Add vouch"""
+    def add_vouch(self, target_id: int, voucher_id: int, reason: str) -> Optional[int]:
+        """Add vouch with its reputation, returns new reputation (None if on cooldown)"""
         try:
             cursor = self.conn.cursor()
+            # Cooldown check + reputation + vouch in one statement - the cooldown
+            # upsert only returns a row when it has expired, and the rest keys off it
             cursor.execute('''
-                INSERT INTO vouches (target_id, voucher_id, reason, rep_amount)
-                VALUES (%s, %s, %s, %s)
-            ''', (target_id, voucher_id, reason, Config.VOUCH_REP_AMOUNT))
-            
-            # Update cooldown
-            cursor.execute('''
-                INSERT INTO cooldowns (user_id, last_vouch)
-                VALUES (%s, CURRENT_TIMESTAMP)
-                ON CONFLICT (user_id)
-                DO UPDATE SET last_vouch = CURRENT_TIMESTAMP
-            ''', (voucher_id,))
-            
+                WITH c AS (
+                    INSERT INTO cooldowns (user_id, last_vouch)
+                    VALUES (%s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET last_vouch = CURRENT_TIMESTAMP
+                    WHERE cooldowns.last_vouch <= CURRENT_TIMESTAMP - make_interval(secs => %s)
+                    RETURNING user_id
+                ), r AS (
+                    INSERT INTO users (user_id, reputation)
+                    SELECT %s, %s FROM c
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET reputation = users.reputation + EXCLUDED.reputation
+                    RETURNING reputation
+                ), v AS (
+                    INSERT INTO vouches (target_id, voucher_id, reason, rep_amount)
+                    SELECT %s, %s, %s, %s FROM c
+                )
+                SELECT reputation FROM r
+            ''', (voucher_id, Config.VOUCH_COOLDOWN,
+                  target_id, Config.VOUCH_REP_AMOUNT,
+                  target_id, voucher_id, reason, Config.VOUCH_REP_AMOUNT))
+            result = cursor.fetchone()
             cursor.close()
+            if not result:
+                return None
+            self._lb_version += 1
+            return result[0]
         except Exception as e:
             logging.error(f"Error adding vouch: {e}")
+            return None
     
     def get_vouch_cooldown(self, user_id: int) -> Optional[float]:
         """Get cooldown in seconds"""
@@ -280,6 +418,44 @@ class DatabaseManager:
             logging.error(f"Error getting cooldown: {e}")
             return None
     
+    def prune_cooldowns(self) -> int:
+        """Delete expired cooldowns, returns number removed"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                DELETE FROM cooldowns
+                WHERE last_vouch < CURRENT_TIMESTAMP - make_interval(secs => %s)
+            ''', (Config.VOUCH_COOLDOWN,))
+            removed = cursor.rowcount
+            cursor.close()
+            return removed
+        except Exception as e:
+            logging.error(f"Error pruning cooldowns: {e}")
+            return 0
+    
+    def prune_vouch_history(self, keep: int) -> int:
+        """Delete all but the newest `keep` vouches per user, returns number removed"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                DELETE FROM vouches
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY target_id ORDER BY created_at DESC, id DESC
+                        ) AS rn
+                        FROM vouches
+                    ) ranked
+                    WHERE rn > %s
+                )
+            ''', (keep,))
+            removed = cursor.rowcount
+            cursor.close()
+            return removed
+        except Exception as e:
+            logging.error(f"Error pruning vouch history: {e}")
+            return 0
+    
     def get_vouch_history(self, user_id: int, limit: int = 10) -> List[Dict]:
         """Get vouch history"""
         try:
@@ -298,12 +474,26 @@ class DatabaseManager:
                 'voucher': row[0],
                 'reason': row[1],
                 'rep_amount': row[2],
-                'timestamp': row[3].isoformat()
+                'timestamp': row[3]
             } for row in results]
         except Exception as e:
             logging.error(f"Error getting history: {e}")
             return []
     
+    def get_vouch_count(self, user_id: int) -> int:
+        """Get number of vouches received"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) FROM vouches WHERE target_id = %s
+            ''', (user_id,))
+            result = cursor.fetchone()
+            cursor.close()
+            return result[0] if result else 0
+        except Exception as e:
+            logging.error(f"Error getting vouch count: {e}")
+            return 0
+    
     # ========================================
     # DUMMY FUNCTIONS
     # ========================================
@@ -312,81 +502,127 @@ class DatabaseManager:
         """Check dummy usage"""
         try:
             cursor = self.conn.cursor()
+            # Same clock as use_dummy - only today's usage counts
             cursor.execute('''
-                SELECT count, usage_date FROM dummy_usage WHERE user_id = %s
+                SELECT count FROM dummy_usage
+                WHERE user_id = %s AND usage_date = CURRENT_DATE
             ''', (user_id,))
             result = cursor.fetchone()
             cursor.close()
             
-            today = datetime.utcnow().date()
-            
             if not result:
                 return True, Config.DUMMY_PER_DAY
             
-            count, usage_date = result
-            
-            if usage_date != today:
-                return True, Config.DUMMY_PER_DAY
-            
-            remaining = Config.DUMMY_PER_DAY - count
+            remaining = Config.DUMMY_PER_DAY - result[0]
             return remaining > 0, remaining
             
         except Exception as e:
             logging.error(f"Error checking dummy: {e}")
             return True, Config.DUMMY_PER_DAY
     
-    def use_dummy(self, user_id: int):
-        """Record dummy usage"""
+    def use_dummy(self, user_id: int, target_id: int) -> Optional[tuple[int, int, int]]:
+        """Record dummy usage and remove its reputation, returns (uses today, old rep, new rep)
+        
+        None if the daily limit is reached.
+        """
         try:
             cursor = self.conn.cursor()
+            # Limit check + usage + reputation in one statement - the usage upsert
+            # only returns a row while under the limit, and the rest keys off it
             cursor.execute('''
-                INSERT INTO dummy_usage (user_id, usage_date, count)
-                VALUES (%s, CURRENT_DATE, 1)
-                ON CONFLICT (user_id)
-                DO UPDATE SET 
-                    count = CASE 
-                        WHEN dummy_usage.usage_date = CURRENT_DATE 
-                        THEN dummy_usage.count + 1 
-                        ELSE 1 
-                    END,
-                    usage_date = CURRENT_DATE
-            ''', (user_id,))
+                WITH d AS (
+                    INSERT INTO dummy_usage (user_id, usage_date, count)
+                    VALUES (%s, CURRENT_DATE, 1)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET 
+                        count = CASE 
+                            WHEN dummy_usage.usage_date = CURRENT_DATE 
+                            THEN dummy_usage.count + 1 
+                            ELSE 1 
+                        END,
+                        usage_date = CURRENT_DATE
+                    WHERE dummy_usage.usage_date <> CURRENT_DATE
+                        OR dummy_usage.count < %s
+                    RETURNING count
+                ), o AS (
+                    SELECT reputation FROM users WHERE user_id = %s
+                ), r AS (
+                    INSERT INTO users (user_id, reputation)
+                    SELECT %s, 0 FROM d
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET reputation = GREATEST(0, users.reputation - %s)
+                    RETURNING reputation
+                )
+                SELECT d.count, COALESCE((SELECT reputation FROM o), 0), r.reputation
+                FROM d, r
+            ''', (user_id, Config.DUMMY_PER_DAY,
+                  target_id,
+                  target_id, Config.DUMMY_REP_REMOVE))
+            result = cursor.fetchone()
             cursor.close()
+            if not result:
+                return None
+            self._lb_version += 1
+            return result
         except Exception as e:
             logging.error(f"Error using dummy: {e}")
+            return None
 
     # ========================================
     # HELPVOUCH FUNCTIONS
     # ========================================
     
-    def add_helpvouch(self, target_id: int, helper_id: int, amount: int):
-        """Add helpvouch"""
+    def add_helpvouch(self, target_id: int, helper_id: int, amount: int) -> Optional[int]:
+        """Add helpvouch with its reputation, returns new reputation (None on error)"""
         try:
             cursor = self.conn.cursor()
+            # Reputation + helpvouch in one statement (atomic, one round trip)
             cursor.execute('''
-                INSERT INTO helpvouches (target_id, helper_id, amount)
-                VALUES (%s, %s, %s)
-            ''', (target_id, helper_id, amount))
+                WITH r AS (
+                    INSERT INTO users (user_id, reputation)
+                    VALUES (%s, %s)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET reputation = users.reputation + EXCLUDED.reputation
+                    RETURNING reputation
+                ), h AS (
+                    INSERT INTO helpvouches (target_id, helper_id, amount)
+                    VALUES (%s, %s, %s)
+                )
+                SELECT reputation FROM r
+            ''', (target_id, amount, target_id, helper_id, amount))
+            result = cursor.fetchone()
+            self._lb_version += 1
             cursor.close()
+            return result[0] if result else None
         except Exception as e:
             logging.error(f"Error adding helpvouch: {e}")
+            return None
     
     # ========================================
     # SCAMMER FUNCTIONS
     # ========================================
     
-    def add_scammer_report(self, user_id: int, reporter_id: int, reason: str):
-        """Add a scammer report (Staff only)"""
+    def add_scammer_report(self, user_id: int, reporter_id: int, reason: str) -> Optional[tuple[int, int]]:
+        """Add a scammer report (Staff only), returns report ID and total reports (None on error)"""
         try:
             cursor = self.conn.cursor()
+            # The CTE insert isn't visible to the count subquery, hence + 1
             cursor.execute('''
-                INSERT INTO scammer_reports (user_id, reporter_id, reason)
-                VALUES (%s, %s, %s)
-            ''', (user_id, reporter_id, reason))
+                WITH new AS (
+                    INSERT INTO scammer_reports (user_id, reporter_id, reason)
+                    VALUES (%s, %s, %s)
+                    RETURNING id
+                )
+                SELECT id, (SELECT COUNT(*) FROM scammer_reports WHERE user_id = %s) + 1
+                FROM new
+            ''', (user_id, reporter_id, reason, user_id))
+            report_id, total_reports = cursor.fetchone()
             cursor.close()
             logging.info(f"Scammer report added: {reporter_id} -> {user_id}")
+            return report_id, total_reports
         except Exception as e:
             logging.error(f"Error adding scammer report: {e}")
+            return None
 
     def get_scammer_reports(self, user_id: int) -> List[Dict]:
         """Get all scammer reports for a user"""
@@ -405,7 +641,7 @@ class DatabaseManager:
                 'id': row[0],
                 'reporter': row[1],
                 'reason': row[2],
-                'timestamp': row[3].isoformat()
+                'timestamp': row[3]
             } for row in results]
         except Exception as e:
             logging.error(f"Error getting scammer reports: {e}")
@@ -522,6 +758,20 @@ class DatabaseManager:
         except Exception as e:
             logging.error(f"Error getting blacklist: {e}")
             return []
+    
+    def get_blacklist_count(self) -> int:
+        """Get number of blacklisted users"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) FROM users WHERE is_blacklisted = TRUE
+            ''')
+            result = cursor.fetchone()
+            cursor.close()
+            return result[0] if result else 0
+        except Exception as e:
+            logging.error(f"Error counting blacklist: {e}")
+            return 0
 
 # Initialize database
 db = DatabaseManager()
@@ -559,14 +809,56 @@ def format_time(seconds: float) -> str:
         return f"{minutes}m {secs}s"
     return f"{secs}s"
 
+def resolve_users(user_ids, guild: Optional[discord.Guild]) -> Dict[int, Optional[discord.abc.User]]:
+    """Resolve ids via the guild member cache, falling back to the global user cache"""
+    get_member = guild.get_member if guild else (lambda _: None)
+    return {user_id: get_member(user_id) or bot.get_user(user_id) for user_id in user_ids}
+
+@tasks.loop(seconds=Config.VOUCH_COOLDOWN)
+async def prune_task():
+    """Drop expired cooldowns and, if VOUCH_HISTORY_LIMIT is set, vouches past the limit"""
+    removed = await asyncio.to_thread(db.prune_cooldowns)
+    if removed:
+        logging.info(f"Pruned {removed} expired cooldowns")
+    
+    if Config.VOUCH_HISTORY_LIMIT > 0:
+        removed = await asyncio.to_thread(db.prune_vouch_history, Config.VOUCH_HISTORY_LIMIT)
+        if removed:
+            logging.info(f"Pruned {removed} old vouches")
+
+# bot.guilds builds a new list on every access - cache the count for /stats
+_guild_count = None
+
+def get_guild_count() -> int:
+    global _guild_count
+    if _guild_count is None:
+        _guild_count = len(bot.guilds)
+    return _guild_count
+
+@bot.event
+async def on_guild_join(guild):
+    global _guild_count
+    _guild_count = None
+
+@bot.event
+async def on_guild_remove(guild):
+    global _guild_count
+    _guild_count = None
+
 @bot.event
 async def on_ready():
-    print('=' * 70)
-    print(f'✅ Bot Online: {bot.user}')
-    print(f'Servers: {len(bot.guilds)}')
-    print(f'Prefix: {Config.PREFIX}')
-    print(f'Database: PostgreSQL ✅')
-    print('=' * 70)
+    global _guild_count
+    _guild_count = None
+    
+    sys.stdout.write('\n'.join([
+        '=' * 70,
+        f'✅ Bot Online: {bot.user}',
+        f'Servers: {get_guild_count()}',
+        f'Prefix: {Config.PREFIX}',
+        'Database: PostgreSQL ✅',
+        '=' * 70,
+    ]) + '\n')
+    sys.stdout.flush()
     
     try:
         synced = await bot.tree.sync()
@@ -574,6 +866,11 @@ async def on_ready():
     except Exception as e:
         logging.error(f'Sync failed: {e}')
     
+    if not prune_task.is_running():
+        prune_task.start()
+    if not error_summary_task.is_running():
+        error_summary_task.start()
+    
     await bot.change_presence(
         activity=discord.Activity(
             type=discord.ActivityType.watching,
@@ -582,27 +879,40 @@ async def on_ready():
         status=discord.Status.online
     )
     
-    print('All systems active!')
-    print('=' * 70)
+    sys.stdout.write('All systems active!\n' + '=' * 70 + '\n')
+    sys.stdout.flush()
 
 # ========================================
 # LEADERBOARD VIEW
 # ========================================
 
+MEDALS = ("🥇", "🥈", "🥉")
+UNKNOWN_USER = "Unknown User"
+
 class LeaderboardView(View):
-    def __init__(self, ctx, pages: List[discord.Embed], timeout=180):
+    def __init__(self, ctx, leaderboard: List[tuple], timeout=180):
         super().__init__(timeout=timeout)
         self.ctx = ctx
-        self.pages = pages
+        self.leaderboard = leaderboard
+        self.total_pages = get_leaderboard_page_count(leaderboard)
+        self.pages: Dict[int, discord.Embed] = {}
         self.current_page = 0
         self.message = None
         self.update_buttons()
     
+    def get_page(self, page_num: int) -> discord.Embed:
+        """Build pages on demand - most views never leave page 1"""
+        page = self.pages.get(page_num)
+        if page is None:
+            page = create_leaderboard_page(self.leaderboard, page_num, self.ctx.guild)
+            self.pages[page_num] = page
+        return page
+    
     def update_buttons(self):
         self.first_page.disabled = self.current_page == 0
         self.prev_page.disabled = self.current_page == 0
-        self.next_page.disabled = self.current_page == len(self.pages) - 1
-        self.last_page.disabled = self.current_page == len(self.pages) - 1
+        self.next_page.disabled = self.current_page == self.total_pages - 1
+        self.last_page.disabled = self.current_page == self.total_pages - 1
     
     @discord.ui.button(label="⏮️", style=discord.ButtonStyle.gray)
     async def first_page(self, interaction: discord.Interaction, button: Button):
@@ -611,7 +921,7 @@ class LeaderboardView(View):
             return
         self.current_page = 0
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await interaction.response.edit_message(embed=self.get_page(self.current_page), view=self)
     
     @discord.ui.button(label="◀️", style=discord.ButtonStyle.primary)
     async def prev_page(self, interaction: discord.Interaction, button: Button):
@@ -620,25 +930,25 @@ class LeaderboardView(View):
             return
         self.current_page = max(0, self.current_page - 1)
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await interaction.response.edit_message(embed=self.get_page(self.current_page), view=self)
     
     @discord.ui.button(label="▶️", style=discord.ButtonStyle.primary)
     async def next_page(self, interaction: discord.Interaction, button: Button):
         if interaction.user.id != self.ctx.author.id:
             await interaction.response.send_message("Only command user can control this.", ephemeral=True)
             return
-        self.current_page = min(len(self.pages) - 1, self.current_page + 1)
+        self.current_page = min(self.total_pages - 1, self.current_page + 1)
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await interaction.response.edit_message(embed=self.get_page(self.current_page), view=self)
     
     @discord.ui.button(label="⏭️", style=discord.ButtonStyle.gray)
     async def last_page(self, interaction: discord.Interaction, button: Button):
         if interaction.user.id != self.ctx.author.id:
             await interaction.response.send_message("Only command user can control this.", ephemeral=True)
             return
-        self.current_page = len(self.pages) - 1
+        self.current_page = self.total_pages - 1
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await interaction.response.edit_message(embed=self.get_page(self.current_page), view=self)
     
     @discord.ui.button(label="🗑️", style=discord.ButtonStyle.danger)
     async def delete_message(self, interaction: discord.Interaction, button: Button):
@@ -657,56 +967,37 @@ class LeaderboardView(View):
             except:
                 pass
 
-def create_leaderboard_pages(leaderboard: List[tuple], bot: commands.Bot) -> List[discord.Embed]:
-    if not leaderboard:
-        embed = discord.Embed(
-            title="📊 Reputation Leaderboard",
-            description="No reputation data yet. Start vouching!",
-            color=discord.Color.blue()
-        )
-        return [embed]
+def get_leaderboard_page_count(leaderboard: List[tuple]) -> int:
+    return (len(leaderboard) + Config.LEADERBOARD_PER_PAGE - 1) // Config.LEADERBOARD_PER_PAGE
+
+def create_leaderboard_page(leaderboard: List[tuple], page_num: int, guild: Optional[discord.Guild]) -> discord.Embed:
+    total_pages = get_leaderboard_page_count(leaderboard)
+    start_idx = page_num * Config.LEADERBOARD_PER_PAGE
+    end_idx = start_idx + Config.LEADERBOARD_PER_PAGE
+    page_data = leaderboard[start_idx:end_idx]
+    users = resolve_users((user_id for user_id, _ in page_data), guild)
+    names = {user_id: user.name for user_id, user in users.items() if user}
     
-    pages = []
-    total_pages = (len(leaderboard) + Config.LEADERBOARD_PER_PAGE - 1) // Config.LEADERBOARD_PER_PAGE
+    embed = discord.Embed(
+        title="📊 Reputation Leaderboard",
+        description="Users ranked by reputation points",
+        color=_GOLD
+    )
     
-    for page_num in range(total_pages):
-        start_idx = page_num * Config.LEADERBOARD_PER_PAGE
-        end_idx = start_idx + Config.LEADERBOARD_PER_PAGE
-        page_data = leaderboard[start_idx:end_idx]
-        
-        embed = discord.Embed(
-            title="📊 Reputation Leaderboard",
-            description="Users ranked by reputation points",
-            color=discord.Color.gold()
-        )
-        
-        leaderboard_text = []
-        for idx, (user_id, rep) in enumerate(page_data, start=start_idx + 1):
-            user = bot.get_user(user_id)
-            
-            if idx == 1:
-                medal = "🥇"
-            elif idx == 2:
-                medal = "🥈"
-            elif idx == 3:
-                medal = "🥉"
-            else:
-                medal = f"`#{idx}`"
-            
-            user_name = user.name if user else f"Unknown User"
-            leaderboard_text.append(f"{medal} **{user_name}** - {rep} rep")
-        
-        embed.add_field(
-            name=f"Rankings {start_idx + 1}-{start_idx + len(page_data)}",
-            value="\n".join(leaderboard_text),
-            inline=False
-        )
-        
-        embed.set_footer(text=f"Page {page_num + 1}/{total_pages} | Total: {len(leaderboard)}")
-        
-        pages.append(embed)
+    leaderboard_text = []
+    for idx, (user_id, rep) in enumerate(page_data, start=start_idx + 1):
+        medal = MEDALS[idx - 1] if idx <= 3 else f"`#{idx}`"
+        leaderboard_text.append(f"{medal} **{names.get(user_id, UNKNOWN_USER)}** - {rep} rep")
     
-    return pages
+    embed.add_field(
+        name=f"Rankings {start_idx + 1}-{start_idx + len(page_data)}",
+        value="\n".join(leaderboard_text),
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Page {page_num + 1}/{total_pages} | Total: {len(leaderboard)}")
+    
+    return embed
 
 # ========================================
 # BASIC COMMANDS
@@ -715,50 +1006,42 @@ def create_leaderboard_pages(leaderboard: List[tuple], bot: commands.Bot) -> Lis
 @bot.command(name='leaderboard', aliases=['lb', 'top'])
 async def leaderboard_cmd(ctx):
     """View reputation leaderboard"""
-    leaderboard = db.get_leaderboard()
+    leaderboard = await asyncio.to_thread(db.get_leaderboard)
     
     if not leaderboard:
         embed = discord.Embed(
             title="📊 Reputation Leaderboard",
             description="No reputation data yet. Use `!vouch @user reason` to give reputation!",
-            color=discord.Color.blue()
+            color=_BLUE
         )
         await ctx.send(embed=embed)
         return
     
-    pages = create_leaderboard_pages(leaderboard, bot)
-    
-    if len(pages) == 1:
-        await ctx.send(embed=pages[0])
+    if get_leaderboard_page_count(leaderboard) == 1:
+        await ctx.send(embed=create_leaderboard_page(leaderboard, 0, ctx.guild))
     else:
-        view = LeaderboardView(ctx, pages)
-        view.message = await ctx.send(embed=pages[0], view=view)
+        view = LeaderboardView(ctx, leaderboard)
+        view.message = await ctx.send(embed=view.get_page(0), view=view)
 
 @bot.command(name='rank', aliases=['rep', 'reputation'])
 async def rank_cmd(ctx, member: discord.Member = None):
     """Check reputation"""
     member = member or ctx.author
     
-    rep = db.get_reputation(member.id)
-    leaderboard = db.get_leaderboard()
-    
-    rank = None
-    for idx, (user_id, _) in enumerate(leaderboard, 1):
-        if user_id == member.id:
-            rank = idx
-            break
+    rep = await asyncio.to_thread(db.get_reputation, member.id)
+    rank, total_users = await asyncio.to_thread(db.get_rank, rep)
     
     embed = discord.Embed(
         title=f"{member.display_name}'s Reputation",
-        color=discord.Color.blue()
+        color=_BLUE
     )
     embed.set_thumbnail(url=member.display_avatar.url)
     
     embed.add_field(name="Reputation", value=f"⭐ {rep}", inline=True)
     embed.add_field(name="Rank", value=f"#{rank}" if rank else "Unranked", inline=True)
-    embed.add_field(name="Total Users", value=str(len(leaderboard)), inline=True)
+    embed.add_field(name="Total Users", value=str(total_users), inline=True)
     
-    recent_vouches = db.get_vouch_history(member.id, limit=5)
+    recent_vouches = await asyncio.to_thread(db.get_vouch_history, member.id, limit=5)
     if recent_vouches:
         vouch_text = []
         for vouch in recent_vouches:
@@ -768,7 +1051,7 @@ async def rank_cmd(ctx, member: discord.Member = None):
         
         embed.add_field(
             name="Recent Vouches (Last 5)",
-            value="\n".join(vouch_text[:5]),
+            value="\n".join(vouch_text),
             inline=False
         )
     
@@ -778,11 +1061,11 @@ async def rank_cmd(ctx, member: discord.Member = None):
 @bot.command(name='cooldown', aliases=['cd'])
 async def cooldown_cmd(ctx):
     """Check vouch cooldown"""
-    cooldown = db.get_vouch_cooldown(ctx.author.id)
+    cooldown = await asyncio.to_thread(db.get_vouch_cooldown, ctx.author.id)
     
     embed = discord.Embed(
         title="⏰ Vouch Cooldown",
-        color=discord.Color.blue()
+        color=_BLUE
     )
     
     if cooldown is None:
@@ -808,85 +1091,104 @@ async def cooldown_cmd(ctx):
 # VOUCH COMMAND
 # ========================================
 
+# Prebuilt rejection embeds - sent as-is, never modified
+_DB_ERROR_EMBED = discord.Embed(
+    title="❌ Database Error",
+    description="Something went wrong saving that. Please try again.",
+    color=_RED
+)
+
+_VOUCH_BLACKLISTED_EMBED = discord.Embed(
+    title="🚫 You Are Blacklisted",
+    description="You have been blacklisted from using the vouch command.",
+    color=_RED
+)
+
+_VOUCH_DISCLAIMER_EMBED = discord.Embed(
+    title="⚠️ Vouch Reason Required",
+    description=(
+        "You must provide a valid reason when vouching for someone.\n\n"
+        "**Proper Usage:**\n"
+        "`!vouch @user reason for vouching`\n\n"
+        "**Examples:**\n"
+        "✅ `!vouch @John Great trader, smooth deal!`\n"
+        "✅ `!vouch @Sarah Trustworthy and fast service`\n"
+        "❌ `!vouch @Mike`\n"
+        "❌ `!vouch @Alex good`\n\n"
+        "⚠️ **WARNING:** Vouching without a valid reason will result in punishment."
+    ),
+    color=_RED
+)
+
+_VOUCH_SELF_EMBED = discord.Embed(
+    title="❌ Cannot Vouch Yourself",
+    description="You cannot vouch for yourself!",
+    color=_RED
+)
+
+_VOUCH_BOT_EMBED = discord.Embed(
+    title="❌ Cannot Vouch Bots",
+    description="You cannot vouch for bots!",
+    color=_RED
+)
+
+# Copied per use - only description and footer change
+_VOUCH_COOLDOWN_EMBED = discord.Embed(
+    title="⏰ Vouch Cooldown Active",
+    color=_ORANGE
+)
+_VOUCH_COOLDOWN_EMBED.add_field(
+    name="Cooldown",
+    value=f"You can vouch once every {Config.VOUCH_COOLDOWN // 60} minutes",
+    inline=False
+)
+
 @bot.command(name='vouch')
 async def vouch_cmd(ctx, member: discord.Member, *, reason: str = None):
     """Vouch for a user and give them reputation"""
     
     # Check if blacklisted
-    if db.is_blacklisted(ctx.author.id):
-        embed = discord.Embed(
-            title="🚫 You Are Blacklisted",
-            description="You have been blacklisted from using the vouch command.",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if await asyncio.to_thread(db.is_blacklisted, ctx.author.id):
+        await ctx.send(embed=_VOUCH_BLACKLISTED_EMBED)
         return
     
     if not reason or len(reason.strip()) < 3:
-        disclaimer_embed = discord.Embed(
-            title="⚠️ Vouch Reason Required",
-            description=(
-                "You must provide a valid reason when vouching for someone.\n\n"
-                "**Proper Usage:**\n"
-                "`!vouch @user reason for vouching`\n\n"
-                "**Examples:**\n"
-                "✅ `!vouch @John Great trader, smooth deal!`\n"
-                "✅ `!vouch @Sarah Trustworthy and fast service`\n"
-                "❌ `!vouch @Mike`\n"
-                "❌ `!vouch @Alex good`\n\n"
-                "⚠️ **WARNING:** Vouching without a valid reason will result in punishment."
-            ),
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=disclaimer_embed)
+        await ctx.send(embed=_VOUCH_DISCLAIMER_EMBED)
         return
     
     if member.id == ctx.author.id:
-        embed = discord.Embed(
-            title="❌ Cannot Vouch Yourself",
-            description="You cannot vouch for yourself!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_VOUCH_SELF_EMBED)
         return
     
     if member.bot:
-        embed = discord.Embed(
-            title="❌ Cannot Vouch Bots",
-            description="You cannot vouch for bots!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_VOUCH_BOT_EMBED)
         return
     
-    cooldown = db.get_vouch_cooldown(ctx.author.id)
+    cooldown = await asyncio.to_thread(db.get_vouch_cooldown, ctx.author.id)
     if cooldown is not None:
-        time_remaining = format_time(cooldown)
-        
-        embed = discord.Embed(
-            title="⏰ Vouch Cooldown Active",
-            description=f"You can vouch again in **{time_remaining}**",
-            color=discord.Color.orange()
-        )
-        embed.add_field(
-            name="Cooldown",
-            value=f"You can vouch once every {Config.VOUCH_COOLDOWN // 60} minutes",
-            inline=False
-        )
+        embed = _VOUCH_COOLDOWN_EMBED.copy()
+        embed.description = f"You can vouch again in **{format_time(cooldown)}**"
         embed.set_footer(text=f"Requested by {ctx.author.name}")
         await ctx.send(embed=embed)
         return
     
-    # Add reputation and vouch
-    db.add_reputation(member.id, Config.VOUCH_REP_AMOUNT)
-    db.add_vouch(member.id, ctx.author.id, reason)
-    
-    new_rep = db.get_reputation(member.id)
+    # Add reputation and vouch - re-checks the cooldown atomically
+    new_rep = await asyncio.to_thread(db.add_vouch, member.id, ctx.author.id, reason)
+    if new_rep is None:
+        cooldown = await asyncio.to_thread(db.get_vouch_cooldown, ctx.author.id)
+        if cooldown is None:
+            await ctx.send(embed=_DB_ERROR_EMBED)
+            return
+        embed = _VOUCH_COOLDOWN_EMBED.copy()
+        embed.description = f"You can vouch again in **{format_time(cooldown)}**"
+        embed.set_footer(text=f"Requested by {ctx.author.name}")
+        await ctx.send(embed=embed)
+        return
     
     embed = discord.Embed(
         title="✅ Vouch Successful",
         description=f"{ctx.author.mention} vouched for {member.mention}",
-        color=discord.Color.green()
+        color=_GREEN
     )
     
     embed.add_field(name="Reason", value=reason, inline=False)
@@ -907,7 +1209,7 @@ async def vouch_cmd(ctx, member: discord.Member, *, reason: str = None):
         dm_embed = discord.Embed(
             title="🎉 You Received a Vouch!",
             description=f"**{ctx.author.name}** vouched for you in **{ctx.guild.name}**",
-            color=discord.Color.gold()
+            color=_GOLD
         )
         dm_embed.add_field(name="Reason", value=reason, inline=False)
         dm_embed.add_field(name="Reputation Gained", value=f"+{Config.VOUCH_REP_AMOUNT} ⭐", inline=True)
@@ -921,13 +1223,13 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
     """View vouch history for a user"""
     member = member or ctx.author
     
-    vouches = db.get_vouch_history(member.id, limit=10)
+    vouches = await asyncio.to_thread(db.get_vouch_history, member.id, limit=10)
     
     if not vouches:
         embed = discord.Embed(
             title=f"{member.display_name}'s Vouch History",
             description="No vouches yet.",
-            color=discord.Color.blue()
+            color=_BLUE
         )
         embed.set_thumbnail(url=member.display_avatar.url)
         await ctx.send(embed=embed)
@@ -936,13 +1238,14 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
     embed = discord.Embed(
         title=f"{member.display_name}'s Vouch History",
         description=f"Showing last {len(vouches)} vouches",
-        color=discord.Color.blue()
+        color=_BLUE
     )
     embed.set_thumbnail(url=member.display_avatar.url)
     
+    name_map = resolve_users((vouch['voucher'] for vouch in vouches), ctx.guild)
     for idx, vouch in enumerate(vouches, 1):
-        voucher = bot.get_user(vouch['voucher'])
-        voucher_name = voucher.name if voucher else "Unknown User"
+        voucher = name_map[vouch['voucher']]
+        voucher_name = voucher.name if voucher else UNKNOWN_USER
         
         embed.add_field(
             name=f"Vouch #{idx} - {voucher_name}",
@@ -950,7 +1253,7 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
             inline=False
         )
     
-    total_rep = db.get_reputation(member.id)
+    total_rep = await asyncio.to_thread(db.get_reputation, member.id)
     embed.set_footer(text=f"Total Reputation: {total_rep} ⭐")
     await ctx.send(embed=embed)
 
@@ -958,32 +1261,35 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
 # DUMMY COMMAND
 # ========================================
 
+async def send_dummy_limit(ctx):
+    embed = discord.Embed(
+        title="❌ Daily Limit Reached",
+        description=f"You have used all {Config.DUMMY_PER_DAY} dummy commands for today.",
+        color=_RED
+    )
+    embed.add_field(
+        name="Reset Time",
+        value="Resets at 00:00 UTC",
+        inline=False
+    )
+    embed.set_footer(text=f"Requested by {ctx.author.name}")
+    await ctx.send(embed=embed)
+
 @bot.command(name='dummy')
 async def dummy_cmd(ctx, member: discord.Member):
     """Remove 3 rep from a user (3 times per day limit)"""
     
-    can_use, remaining = db.can_use_dummy(ctx.author.id)
+    can_use, _ = await asyncio.to_thread(db.can_use_dummy, ctx.author.id)
     
     if not can_use:
-        embed = discord.Embed(
-            title="❌ Daily Limit Reached",
-            description=f"You have used all {Config.DUMMY_PER_DAY} dummy commands for today.",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="Reset Time",
-            value="Resets at 00:00 UTC",
-            inline=False
-        )
-        embed.set_footer(text=f"Requested by {ctx.author.name}")
-        await ctx.send(embed=embed)
+        await send_dummy_limit(ctx)
         return
     
     if member.id == ctx.author.id:
         embed = discord.Embed(
             title="❌ Cannot Dummy Yourself",
             description="You cannot use dummy on yourself!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -992,20 +1298,26 @@ async def dummy_cmd(ctx, member: discord.Member):
         embed = discord.Embed(
             title="❌ Cannot Dummy Bots",
             description="You cannot use dummy on bots!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.remove_reputation(member.id, Config.DUMMY_REP_REMOVE)
-    db.use_dummy(ctx.author.id)
-    new_rep = db.get_reputation(member.id)
+    # Re-checks the daily limit atomically
+    result = await asyncio.to_thread(db.use_dummy, ctx.author.id, member.id)
+    if result is None:
+        can_use, _ = await asyncio.to_thread(db.can_use_dummy, ctx.author.id)
+        if can_use:
+            await ctx.send(embed=_DB_ERROR_EMBED)
+        else:
+            await send_dummy_limit(ctx)
+        return
+    used, old_rep, new_rep = result
     
     embed = discord.Embed(
         title="💥 Dummy Used",
         description=f"{ctx.author.mention} used dummy on {member.mention}",
-        color=discord.Color.orange()
+        color=_ORANGE
     )
     
     embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
@@ -1013,7 +1325,7 @@ async def dummy_cmd(ctx, member: discord.Member):
     embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
     embed.add_field(
         name="Remaining Uses Today",
-        value=f"{remaining - 1}/{Config.DUMMY_PER_DAY}",
+        value=f"{Config.DUMMY_PER_DAY - used}/{Config.DUMMY_PER_DAY}",
         inline=False
     )
     
@@ -1033,7 +1345,7 @@ async def helpvouch_cmd(ctx, member: discord.Member):
         embed = discord.Embed(
             title="❌ Cannot Helpvouch Yourself",
             description="You cannot helpvouch yourself!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -1042,7 +1354,7 @@ async def helpvouch_cmd(ctx, member: discord.Member):
         embed = discord.Embed(
             title="❌ Cannot Helpvouch Bots",
             description="You cannot helpvouch bots!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -1051,15 +1363,16 @@ async def helpvouch_cmd(ctx, member: discord.Member):
     is_staff = has_staff_role(ctx.author)
     rep_amount = Config.HELPVOUCH_REP_STAFF if is_staff else Config.HELPVOUCH_REP_MEMBER
     
-    old_rep = db.get_reputation(member.id)
-    db.add_reputation(member.id, rep_amount)
-    db.add_helpvouch(member.id, ctx.author.id, rep_amount)
-    new_rep = db.get_reputation(member.id)
+    new_rep = await asyncio.to_thread(db.add_helpvouch, member.id, ctx.author.id, rep_amount)
+    if new_rep is None:
+        await ctx.send(embed=_DB_ERROR_EMBED)
+        return
+    old_rep = new_rep - rep_amount
     
     embed = discord.Embed(
         title="✅ Helpvouch Successful",
         description=f"{ctx.author.mention} helped {member.mention}",
-        color=discord.Color.green()
+        color=_GREEN
     )
     
     if is_staff:
@@ -1092,13 +1405,13 @@ async def helpvouch_cmd(ctx, member: discord.Member):
 async def repblacklist_cmd(ctx, member: discord.Member):
     """Blacklist/unblacklist a user from using vouch (Owner only)"""
     
-    if db.is_blacklisted(member.id):
-        db.remove_from_blacklist(member.id)
+    if await asyncio.to_thread(db.is_blacklisted, member.id):
+        await asyncio.to_thread(db.remove_from_blacklist, member.id)
         
         embed = discord.Embed(
             title="✅ User Unblacklisted",
             description=f"{member.mention} can now use the vouch command again.",
-            color=discord.Color.green()
+            color=_GREEN
         )
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.set_footer(text=f"Unblacklisted by {ctx.author.name}")
@@ -1106,12 +1419,12 @@ async def repblacklist_cmd(ctx, member: discord.Member):
         await ctx.send(embed=embed)
         logging.info(f"Owner {ctx.author.name} unblacklisted {member.name}")
     else:
-        db.add_to_blacklist(member.id)
+        await asyncio.to_thread(db.add_to_blacklist, member.id)
         
         embed = discord.Embed(
             title="🚫 User Blacklisted",
             description=f"{member.mention} can no longer use the vouch command.",
-            color=discord.Color.red()
+            color=_RED
         )
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.set_footer(text=f"Blacklisted by {ctx.author.name}")
@@ -1123,13 +1436,13 @@ async def repblacklist_cmd(ctx, member: discord.Member):
 @is_owner()
 async def viewblacklist_cmd(ctx):
     """View all blacklisted users (Owner only)"""
-    blacklist = db.get_blacklist()
+    blacklist = await asyncio.to_thread(db.get_blacklist)
     
     if not blacklist:
         embed = discord.Embed(
             title="📋 Blacklist",
             description="No users are currently blacklisted.",
-            color=discord.Color.blue()
+            color=_BLUE
         )
         await ctx.send(embed=embed)
         return
@@ -1137,7 +1450,7 @@ async def viewblacklist_cmd(ctx):
     embed = discord.Embed(
         title="📋 Blacklisted Users",
         description=f"Total: {len(blacklist)} users",
-        color=discord.Color.red()
+        color=_RED
     )
     
     blacklist_text = []
@@ -1173,7 +1486,7 @@ def is_staff():
             embed = discord.Embed(
                 title="🚫 Staff Only",
                 description="Only staff members can use this command.",
-                color=discord.Color.red()
+                color=_RED
             )
             await ctx.send(embed=embed)
             return False
@@ -1189,7 +1502,7 @@ async def applyscammer_cmd(ctx, member: discord.Member, *, reason: str = None):
         embed = discord.Embed(
             title="⚠️ Reason Required",
             description="You must provide a detailed reason when reporting a scammer.",
-            color=discord.Color.red()
+            color=_RED
         )
         embed.add_field(
             name="Usage",
@@ -1208,7 +1521,7 @@ async def applyscammer_cmd(ctx, member: discord.Member, *, reason: str = None):
         embed = discord.Embed(
             title="❌ Cannot Report Yourself",
             description="You cannot report yourself as a scammer!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -1217,22 +1530,22 @@ async def applyscammer_cmd(ctx, member: discord.Member, *, reason: str = None):
         embed = discord.Embed(
             title="❌ Cannot Report Bots",
             description="You cannot report bots as scammers!",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
     
     # Add scammer report to database
-    db.add_scammer_report(member.id, ctx.author.id, reason)
-    
-    # Get total reports for this user
-    reports = db.get_scammer_reports(member.id)
-    total_reports = len(reports)
+    result = await asyncio.to_thread(db.add_scammer_report, member.id, ctx.author.id, reason)
+    if result is None:
+        await ctx.send(embed=_DB_ERROR_EMBED)
+        return
+    report_id, total_reports = result
     
     embed = discord.Embed(
         title="🚨 Scammer Report Added",
         description=f"{member.mention} has been reported as a scammer",
-        color=discord.Color.red()
+        color=_RED
     )
     
     embed.add_field(name="Reported By", value=ctx.author.mention, inline=True)
@@ -1240,7 +1553,7 @@ async def applyscammer_cmd(ctx, member: discord.Member, *, reason: str = None):
     embed.add_field(name="Reason", value=reason, inline=False)
     
     embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Report ID: {reports[0]['id']} | Reported by {ctx.author.name}")
+    embed.set_footer(text=f"Report ID: {report_id} | Reported by {ctx.author.name}")
     
     await ctx.send(embed=embed)
     
@@ -1254,13 +1567,13 @@ async def applyscammer_cmd(ctx, member: discord.Member, *, reason: str = None):
 async def scam_cmd(ctx, member: discord.Member):
     """Check if a user has been reported as a scammer (Anyone can use)"""
     
-    reports = db.get_scammer_reports(member.id)
+    reports = await asyncio.to_thread(db.get_scammer_reports, member.id)
     
     if not reports:
         embed = discord.Embed(
             title="✅ No Scammer Reports",
             description=f"{member.mention} has **no scammer reports**.",
-            color=discord.Color.green()
+            color=_GREEN
         )
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.set_footer(text=f"Checked by {ctx.author.name}")
@@ -1271,7 +1584,7 @@ async def scam_cmd(ctx, member: discord.Member):
     embed = discord.Embed(
         title="🚨 SCAMMER ALERT 🚨",
         description=f"{member.mention} has been reported as a scammer!",
-        color=discord.Color.dark_red()
+        color=_DARK_RED
     )
     
     embed.set_thumbnail(url=member.display_avatar.url)
@@ -1281,9 +1594,7 @@ async def scam_cmd(ctx, member: discord.Member):
         reporter = bot.get_user(report['reporter'])
         reporter_name = reporter.name if reporter else "Unknown Staff"
         
-        # Parse timestamp
-        timestamp = datetime.fromisoformat(report['timestamp'])
-        time_str = timestamp.strftime('%Y-%m-%d %H:%M UTC')
+        time_str = report['timestamp'].strftime('%Y-%m-%d %H:%M UTC')
         
         embed.add_field(
             name=f"🚩 Report #{idx} - By {reporter_name}",
@@ -1310,13 +1621,13 @@ async def scam_cmd(ctx, member: discord.Member):
 async def removescammer_cmd(ctx, member: discord.Member, report_id: int = None):
     """Remove a scammer report (STAFF ONLY)"""
     
-    reports = db.get_scammer_reports(member.id)
+    reports = await asyncio.to_thread(db.get_scammer_reports, member.id)
     
     if not reports:
         embed = discord.Embed(
             title="❌ No Reports Found",
             description=f"{member.mention} has no scammer reports.",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -1326,7 +1637,7 @@ async def removescammer_cmd(ctx, member: discord.Member, report_id: int = None):
         embed = discord.Embed(
             title=f"📋 Scammer Reports for {member.display_name}",
             description="Use the Report ID to remove a specific report",
-            color=discord.Color.blue()
+            color=_BLUE
         )
         
         for idx, report in enumerate(reports, 1):
@@ -1357,7 +1668,7 @@ async def removescammer_cmd(ctx, member: discord.Member, report_id: int = None):
         embed = discord.Embed(
             title="❌ Invalid Report ID",
             description=f"Report ID `{report_id}` not found for {member.mention}",
-            color=discord.Color.red()
+            color=_RED
         )
         embed.add_field(
             name="Available Report IDs",
@@ -1368,14 +1679,14 @@ async def removescammer_cmd(ctx, member: discord.Member, report_id: int = None):
         return
     
     # Remove the report
-    db.remove_scammer_report(report_id)
+    await asyncio.to_thread(db.remove_scammer_report, report_id)
     
     remaining_reports = len(reports) - 1
     
     embed = discord.Embed(
         title="✅ Scammer Report Removed",
         description=f"Report ID `{report_id}` has been removed for {member.mention}",
-        color=discord.Color.green()
+        color=_GREEN
     )
     
     embed.add_field(name="Remaining Reports", value=f"{remaining_reports} 🚩", inline=True)
@@ -1393,13 +1704,13 @@ async def removescammer_cmd(ctx, member: discord.Member, report_id: int = None):
 async def clearallscam_cmd(ctx, member: discord.Member):
     """Clear ALL scammer reports for a user (STAFF ONLY)"""
     
-    reports = db.get_scammer_reports(member.id)
+    reports = await asyncio.to_thread(db.get_scammer_reports, member.id)
     
     if not reports:
         embed = discord.Embed(
             title="❌ No Reports Found",
             description=f"{member.mention} has no scammer reports to clear.",
-            color=discord.Color.red()
+            color=_RED
         )
         await ctx.send(embed=embed)
         return
@@ -1410,7 +1721,7 @@ async def clearallscam_cmd(ctx, member: discord.Member):
     confirm_embed = discord.Embed(
         title="⚠️ Confirm Clear All Reports",
         description=f"Are you sure you want to remove ALL scammer reports for {member.mention}?",
-        color=discord.Color.orange()
+        color=_ORANGE
     )
     confirm_embed.add_field(name="Reports to Clear", value=f"{report_count} 🚩", inline=True)
     confirm_embed.add_field(
@@ -1430,12 +1741,12 @@ async def clearallscam_cmd(ctx, member: discord.Member):
         reaction, user = await bot.wait_for('reaction_add', timeout=30.0, check=check)
         
         if str(reaction.emoji) == "✅":
-            db.clear_all_scammer_reports(member.id)
+            await asyncio.to_thread(db.clear_all_scammer_reports, member.id)
             
             success_embed = discord.Embed(
                 title="✅ All Reports Cleared",
                 description=f"All {report_count} scammer reports cleared for {member.mention}",
-                color=discord.Color.green()
+                color=_GREEN
             )
             success_embed.set_thumbnail(url=member.display_avatar.url)
             success_embed.set_footer(text=f"Cleared by {ctx.author.name}")
@@ -1448,7 +1759,7 @@ async def clearallscam_cmd(ctx, member: discord.Member):
             cancel_embed = discord.Embed(
                 title="❌ Action Cancelled",
                 description="Clear all reports cancelled",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             await msg.edit(embed=cancel_embed)
             await msg.clear_reactions()
@@ -1457,7 +1768,7 @@ async def clearallscam_cmd(ctx, member: discord.Member):
         timeout_embed = discord.Embed(
             title="⏰ Confirmation Timeout",
             description="Action cancelled due to timeout",
-            color=discord.Color.orange()
+            color=_ORANGE
         )
         await msg.edit(embed=timeout_embed)
         await msg.clear_reactions()
@@ -1475,13 +1786,13 @@ Add this command after Part 2 commands
 async def listscammers_cmd(ctx):
     """View all users reported as scammers (Anyone can use)"""
     
-    scammers = db.get_all_scammers()
+    scammers = await asyncio.to_thread(db.get_all_scammers)
     
     if not scammers:
         embed = discord.Embed(
             title="✅ No Scammer Reports",
             description="No users have been reported as scammers yet.",
-            color=discord.Color.green()
+            color=_GREEN
         )
         embed.set_footer(text=f"Requested by {ctx.author.name}")
         await ctx.send(embed=embed)
@@ -1491,7 +1802,7 @@ async def listscammers_cmd(ctx):
     embed = discord.Embed(
         title="🚨 Reported Scammers List",
         description=f"Total users with scammer reports: **{len(scammers)}**",
-        color=discord.Color.dark_red()
+        color=_DARK_RED
     )
     
     scammer_text = []
@@ -1556,14 +1867,16 @@ async def addrep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount must be greater than 0")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.add_reputation(member.id, amount)
-    new_rep = db.get_reputation(member.id)
+    new_rep = await asyncio.to_thread(db.add_reputation, member.id, amount)
+    if new_rep is None:
+        await ctx.send(embed=_DB_ERROR_EMBED)
+        return
+    old_rep = new_rep - amount
     
     embed = discord.Embed(
         title="✅ Reputation Added",
         description=f"Added reputation to {member.mention}",
-        color=discord.Color.green()
+        color=_GREEN
     )
     
     embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
@@ -1582,14 +1895,17 @@ async def removerep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount must be greater than 0")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.remove_reputation(member.id, amount)
-    new_rep = db.get_reputation(member.id)
+    # Removal clamps at 0, so the previous value can't be derived
+    old_rep = await asyncio.to_thread(db.get_reputation, member.id)
+    new_rep = await asyncio.to_thread(db.remove_reputation, member.id, amount)
+    if new_rep is None:
+        await ctx.send(embed=_DB_ERROR_EMBED)
+        return
     
     embed = discord.Embed(
         title="✅ Reputation Removed",
         description=f"Removed reputation from {member.mention}",
-        color=discord.Color.orange()
+        color=_ORANGE
     )
     
     embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
@@ -1608,13 +1924,15 @@ async def setrep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount cannot be negative")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.set_reputation(member.id, amount)
+    old_rep = await asyncio.to_thread(db.get_reputation, member.id)
+    if await asyncio.to_thread(db.set_reputation, member.id, amount) is None:
+        await ctx.send(embed=_DB_ERROR_EMBED)
+        return
     
     embed = discord.Embed(
         title="✅ Reputation Set",
         description=f"Set reputation for {member.mention}",
-        color=discord.Color.blue()
+        color=_BLUE
     )
     
     embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
@@ -1629,13 +1947,13 @@ async def setrep_cmd(ctx, member: discord.Member, amount: int):
 @is_owner()
 async def clearrep_cmd(ctx, member: discord.Member):
     """Clear all reputation data (Owner only)"""
-    old_rep = db.get_reputation(member.id)
-    vouch_count = len(db.get_vouch_history(member.id, limit=999))
+    old_rep = await asyncio.to_thread(db.get_reputation, member.id)
+    vouch_count = await asyncio.to_thread(db.get_vouch_count, member.id)
     
     confirm_embed = discord.Embed(
         title="⚠️ Confirm Clear Reputation",
         description=f"Are you sure you want to clear all data for {member.mention}?",
-        color=discord.Color.red()
+        color=_RED
     )
     confirm_embed.add_field(name="Reputation to Clear", value=f"{old_rep} ⭐", inline=True)
     confirm_embed.add_field(name="Vouches to Clear", value=str(vouch_count), inline=True)
@@ -1656,12 +1974,12 @@ async def clearrep_cmd(ctx, member: discord.Member):
         reaction, user = await bot.wait_for('reaction_add', timeout=30.0, check=check)
         
         if str(reaction.emoji) == "✅":
-            db.clear_reputation(member.id)
+            await asyncio.to_thread(db.clear_reputation, member.id)
             
             success_embed = discord.Embed(
                 title="✅ Reputation Cleared",
                 description=f"All reputation data cleared for {member.mention}",
-                color=discord.Color.green()
+                color=_GREEN
             )
             success_embed.add_field(name="Reputation Cleared", value=f"{old_rep} ⭐", inline=True)
             success_embed.add_field(name="Vouches Cleared", value=str(vouch_count), inline=True)
@@ -1673,7 +1991,7 @@ async def clearrep_cmd(ctx, member: discord.Member):
             cancel_embed = discord.Embed(
                 title="❌ Action Cancelled",
                 description="Reputation clear cancelled",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             await msg.edit(embed=cancel_embed)
             await msg.clear_reactions()
@@ -1682,7 +2000,7 @@ async def clearrep_cmd(ctx, member: discord.Member):
         timeout_embed = discord.Embed(
             title="⏰ Confirmation Timeout",
             description="Action cancelled due to timeout",
-            color=discord.Color.orange()
+            color=_ORANGE
         )
         await msg.edit(embed=timeout_embed)
         await msg.clear_reactions()
@@ -1691,10 +2009,9 @@ async def clearrep_cmd(ctx, member: discord.Member):
 @is_owner()
 async def repstats_cmd(ctx):
     """View system statistics (Owner only)"""
-    leaderboard = db.get_leaderboard()
-    total_users = len(leaderboard)
-    total_rep = sum(rep for _, rep in leaderboard)
-    blacklist = db.get_blacklist()
+    total_users, total_rep = await asyncio.to_thread(db.get_reputation_totals)
+    leaderboard = await asyncio.to_thread(db.get_leaderboard, limit=1)
+    blacklisted = await asyncio.to_thread(db.get_blacklist_count)
     
     top_user = None
     if leaderboard:
@@ -1703,12 +2020,12 @@ async def repstats_cmd(ctx):
     
     embed = discord.Embed(
         title="📊 Reputation System Statistics",
-        color=discord.Color.blue(),
+        color=_BLUE,
     )
     
     embed.add_field(name="Total Users", value=str(total_users), inline=True)
     embed.add_field(name="Total Reputation", value=f"{total_rep} ⭐", inline=True)
-    embed.add_field(name="Blacklisted Users", value=str(len(blacklist)), inline=True)
+    embed.add_field(name="Blacklisted Users", value=str(blacklisted), inline=True)
     
     embed.add_field(name="Vouch Cooldown", value=f"{Config.VOUCH_COOLDOWN // 60} min", inline=True)
     embed.add_field(name="Vouch Amount", value=f"{Config.VOUCH_REP_AMOUNT} ⭐", inline=True)
@@ -1734,15 +2051,11 @@ async def repstats_cmd(ctx):
 # HELP COMMAND
 # ========================================
 
-@bot.command(name='help')
-async def help_cmd(ctx):
-    """Display all commands"""
-    is_owner_user = ctx.author.id == Config.OWNER_ID
-    
+def _build_help_embed(is_owner_user: bool) -> discord.Embed:
     embed = discord.Embed(
         title="📖 Reputation Bot - Commands",
         description=f"Prefix: `{Config.PREFIX}` | Commands 👇",
-        color=discord.Color.blue()
+        color=_BLUE
     )
     
     embed.add_field(
@@ -1789,6 +2102,17 @@ async def help_cmd(ctx):
         inline=False
     )
     
+    return embed
+
+# Built once - only the footer differs per call
+_HELP_EMBED_USER = _build_help_embed(False)
+_HELP_EMBED_OWNER = _build_help_embed(True)
+
+@bot.command(name='help')
+async def help_cmd(ctx):
+    """Display all commands"""
+    base = _HELP_EMBED_OWNER if ctx.author.id == Config.OWNER_ID else _HELP_EMBED_USER
+    embed = base.copy()
     embed.set_footer(text=f"Requested by {ctx.author.name}")
     await ctx.send(embed=embed)
 
@@ -1796,42 +2120,94 @@ async def help_cmd(ctx):
 # ERROR HANDLER
 # ========================================
 
+# Copied per use - only the description changes
+_MISSING_ARG_EMBED = discord.Embed(
+    title="❌ Missing Argument",
+    color=_RED
+)
+_MISSING_ARG_EMBED.add_field(
+    name="Help",
+    value=f"Use `{Config.PREFIX}help` for command usage",
+    inline=False
+)
+
+# user_id -> (tokens, last_update) for unexpected-error replies
+_error_buckets: Dict[int, tuple[float, float]] = {}
+_suppressed_errors = 0
+
+def allow_error_reply(user_id: int) -> bool:
+    """Token bucket - ERROR_REPLY_RATE replies per ERROR_REPLY_PER seconds per user"""
+    now = time.monotonic()
+    tokens, last = _error_buckets.get(user_id, (Config.ERROR_REPLY_RATE, now))
+    tokens = min(Config.ERROR_REPLY_RATE, tokens + (now - last) * Config.ERROR_REPLY_RATE / Config.ERROR_REPLY_PER)
+    allowed = tokens >= 1
+    _error_buckets[user_id] = (tokens - 1 if allowed else tokens, now)
+    return allowed
+
+async def handle_missing_argument(ctx, error):
+    embed = _MISSING_ARG_EMBED.copy()
+    embed.description = f"Missing: `{error.param.name}`"
+    await ctx.send(embed=embed)
+
+async def handle_member_not_found(ctx, error):
+    await ctx.send("Member not found. Mention a valid server member.")
+
+async def handle_bad_argument(ctx, error):
+    await ctx.send("Invalid argument. Check your command syntax.")
+
+@tasks.loop(minutes=1)
+async def error_summary_task():
+    """Log suppressed errors once a minute and drop buckets that have refilled"""
+    global _suppressed_errors
+    if _suppressed_errors:
+        logging.error(f'Suppressed {_suppressed_errors} errors from rate-limited users')
+        _suppressed_errors = 0
+    
+    now = time.monotonic()
+    for user_id, (tokens, last) in list(_error_buckets.items()):
+        if tokens + (now - last) * Config.ERROR_REPLY_RATE / Config.ERROR_REPLY_PER >= Config.ERROR_REPLY_RATE:
+            del _error_buckets[user_id]
+
+async def handle_unexpected_error(ctx, error):
+    global _suppressed_errors
+    if not allow_error_reply(ctx.author.id):
+        _suppressed_errors += 1
+        return
+    
+    logging.error(f'Error in {ctx.command}: {error}')
+    await ctx.send("An error occurred.")
+
+# Error type -> handler, None = ignore silently
+ERROR_HANDLERS = {
+    commands.CommandNotFound: None,
+    commands.MissingRequiredArgument: handle_missing_argument,
+    commands.MemberNotFound: handle_member_not_found,
+    commands.BadArgument: handle_bad_argument,
+    commands.CheckFailure: None,
+}
+
+@functools.lru_cache(maxsize=None)
+def find_error_handler(error_type: type):
+    """Most specific registered handler for an error type (subclasses resolve via MRO)"""
+    for cls in error_type.__mro__:
+        if cls in ERROR_HANDLERS:
+            return ERROR_HANDLERS[cls]
+    return handle_unexpected_error
+
 @bot.event
 async def on_command_error(ctx, error):
     """Handle errors"""
-    if isinstance(error, commands.CommandNotFound):
-        return
-    
-    elif isinstance(error, commands.MissingRequiredArgument):
-        embed = discord.Embed(
-            title="❌ Missing Argument",
-            description=f"Missing: `{error.param.name}`",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="Help",
-            value=f"Use `{Config.PREFIX}help` for command usage",
-            inline=False
-        )
-        await ctx.send(embed=embed)
-    
-    elif isinstance(error, commands.MemberNotFound):
-        await ctx.send("Member not found. Mention a valid server member.")
-    
-    elif isinstance(error, commands.BadArgument):
-        await ctx.send("Invalid argument. Check your command syntax.")
-    
-    elif isinstance(error, commands.CheckFailure):
-        pass
-    
-    else:
-        logging.error(f'Error in {ctx.command}: {error}')
-        await ctx.send("An error occurred.")
+    handler = find_error_handler(type(error))
+    if handler:
+        await handler(ctx, error)
 
 # ========================================
 # WEB SERVER FOR RENDER
 # ========================================
 
+# Status page shell - served as a file, live numbers come from /stats
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
 async def start_keep_alive():
     """Web server for Render"""
     from aiohttp import web
@@ -1840,78 +2216,64 @@ async def start_keep_alive():
         return web.Response(text='Bot Online!', status=200)
     
     async def status_page(request):
-        leaderboard = db.get_leaderboard()
-        total_rep = sum(rep for _, rep in leaderboard)
-        blacklist = db.get_blacklist()
+        # Sends the precompressed index.html.gz sibling to gzip clients -
+        # regenerate it after editing index.html: gzip -9 -n -k static/index.html
+        return web.FileResponse(os.path.join(STATIC_DIR, 'index.html'))
+    
+    # path -> (rendered_at, body, etag)
+    response_cache = {}
+    
+    async def cached_response(request, render, content_type):
+        """Serve a rendered body for STATUS_CACHE_TTL seconds, with ETag revalidation"""
+        now = asyncio.get_running_loop().time()
+        entry = response_cache.get(request.path)
+        if entry is None or now - entry[0] >= Config.STATUS_CACHE_TTL:
+            body = await render()
+            entry = (now, body, f'"{hashlib.md5(body).hexdigest()}"')
+            response_cache[request.path] = entry
+        
+        _, body, etag = entry
+        headers = {
+            'Cache-Control': f'public, max-age={Config.STATUS_CACHE_TTL}',
+            'ETag': etag
+        }
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type=content_type, charset='utf-8', headers=headers)
+    
+    async def render_stats():
+        total_users, total_rep = await asyncio.to_thread(db.get_reputation_totals)
+        blacklisted = await asyncio.to_thread(db.get_blacklist_count)
         
-        html = f'''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Reputation Bot</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            font-family: monospace;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-        }}
-        .container {{
-            text-align: center;
-            padding: 40px;
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 20px;
-            backdrop-filter: blur(10px);
-            max-width: 600px;
-        }}
-        h1 {{ font-size: 48px; margin: 0 0 20px 0; }}
-        .status {{ font-size: 24px; margin: 20px 0; color: #0f0; }}
-        .info {{ font-size: 18px; margin: 10px 0; }}
-        .badge {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 20px;
-            margin: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>⭐ Reputation Bot</h1>
-        <div class="status">✅ ONLINE</div>
-        <div class="info">Servers: {len(bot.guilds)}</div>
-        <div class="info">Total Users: {len(leaderboard)}</div>
-        <div class="info">Total Rep: {total_rep}</div>
-        <div class="info">Blacklisted: {len(blacklist)}</div>
-        <div class="info">Database: PostgreSQL ✅</div>
-        <div style="margin-top: 20px;">
-            <span class="badge">Vouch: {Config.VOUCH_REP_AMOUNT}⭐</span>
-            <span class="badge">Cooldown: {Config.VOUCH_COOLDOWN // 60}m</span>
-            <span class="badge">Dummy: {Config.DUMMY_PER_DAY}x/day</span>
-        </div>
-    </div>
-</body>
-</html>
-        '''
-        return web.Response(text=html, content_type='text/html')
+        return orjson.dumps({
+            'servers': get_guild_count(),
+            'users': total_users,
+            'total_rep': total_rep,
+            'blacklisted': blacklisted,
+            'vouch_amount': Config.VOUCH_REP_AMOUNT,
+            'cooldown_minutes': Config.VOUCH_COOLDOWN // 60,
+            'dummy_per_day': Config.DUMMY_PER_DAY
+        })
+    
+    async def stats(request):
+        return await cached_response(request, render_stats, 'application/json')
     
     app = web.Application()
     app.router.add_get('/', status_page)
+    app.router.add_get('/stats', stats)
+    app.router.add_static('/static/', STATIC_DIR, show_index=False)
     app.router.add_get('/health', health)
     app.router.add_get('/ping', health)
     
     runner = web.AppRunner(app)
     await runner.setup()
-    site = web.TCPSite(runner, '0.0.0.0', Config.PORT)
+    if Config.SOCKET_PATH:
+        site = web.UnixSite(runner, Config.SOCKET_PATH)
+    else:
+        site = web.TCPSite(runner, '0.0.0.0', Config.PORT)
     await site.start()
     
-    logging.info(f'🌐 Web server: port {Config.PORT}')
+    logging.info(f'🌐 Web server: {Config.SOCKET_PATH or f"port {Config.PORT}"}')
 
 # ========================================
 # MAIN STARTUP
@@ -1919,29 +2281,51 @@ async def start_keep_alive():
 
 async def main():
     """Main startup"""
-    await start_keep_alive()
+    import aiohttp
+    
+    # One keep-alive connection pool for Discord REST and any outbound HTTP
+    connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=120, ttl_dns_cache=300)
+    bot.http.connector = connector
+    bot.http_session = aiohttp.ClientSession(connector=connector, connector_owner=False)
     
     try:
-        await bot.start(Config.TOKEN)
+        await start_keep_alive()
+        
+        # Connect to the database while logging in to Discord
+        await asyncio.gather(
+            asyncio.to_thread(db.setup),
+            bot.login(Config.TOKEN)
+        )
+        # Gateway reconnects happen inside connect() and keep the same session/connector
+        await bot.connect(reconnect=True)
     except KeyboardInterrupt:
         logging.info('Shutdown requested')
-        await bot.close()
     except Exception as e:
         logging.error(f'Bot error: {e}')
-        await bot.close()
+    finally:
+        # Also reached on cancellation, which the except clauses don't catch
+        if not bot.is_closed():
+            await bot.close()
+        await bot.http_session.close()
+        await connector.close()
 
 if __name__ == '__main__':
-    print('=' * 70)
-    print('REPUTATION BOT - PostgreSQL Version')
-    print('=' * 70)
-    print(f'Owner ID: {Config.OWNER_ID}')
-    print(f'Prefix: {Config.PREFIX}')
-    print(f'Vouch: {Config.VOUCH_REP_AMOUNT}⭐ | Cooldown: {Config.VOUCH_COOLDOWN // 60}m')
-    print(f'Helpvouch: Staff {Config.HELPVOUCH_REP_STAFF}⭐ | Member {Config.HELPVOUCH_REP_MEMBER}⭐')
-    print(f'Dummy: Remove {Config.DUMMY_REP_REMOVE}⭐ ({Config.DUMMY_PER_DAY}x/day)')
-    print(f'Database: PostgreSQL ✅')
-    print(f'Port: {Config.PORT}')
-    print('=' * 70)
+    # One write instead of a flush per line
+    banner = '\n'.join([
+        '=' * 70,
+        'REPUTATION BOT - PostgreSQL Version',
+        '=' * 70,
+        f'Owner ID: {Config.OWNER_ID}',
+        f'Prefix: {Config.PREFIX}',
+        f'Vouch: {Config.VOUCH_REP_AMOUNT}⭐ | Cooldown: {Config.VOUCH_COOLDOWN // 60}m',
+        f'Helpvouch: Staff {Config.HELPVOUCH_REP_STAFF}⭐ | Member {Config.HELPVOUCH_REP_MEMBER}⭐',
+        f'Dummy: Remove {Config.DUMMY_REP_REMOVE}⭐ ({Config.DUMMY_PER_DAY}x/day)',
+        'Database: PostgreSQL ✅',
+        f'Port: {Config.PORT}',
+        '=' * 70,
+    ])
+    sys.stdout.write(banner + '\n')
+    sys.stdout.flush()
     
     if not Config.TOKEN:
         print('\n❌ DISCORD_BOT_TOKEN not set!')
@@ -1952,6 +2336,13 @@ if __name__ == '__main__':
         print('Create PostgreSQL database on Render and add DATABASE_URL')
         exit(1)
     
+    # libuv event loop where available - faster socket I/O for gateway and web server
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt: